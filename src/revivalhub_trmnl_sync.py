@@ -8,18 +8,23 @@ GitHub Actions publishes the JSON to GitHub Pages for the plugin to poll.
 from __future__ import annotations
 
 import argparse
+import bisect
 import dataclasses
 import datetime as dt
+import functools
+import hashlib
 import json
 import logging
-import os
 import re
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Iterable, Mapping, MutableMapping, Sequence
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 try:
     from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -27,6 +32,24 @@ except ImportError:  # pragma: no cover
     ZoneInfo = None  # type: ignore[assignment]
     ZoneInfoNotFoundError = Exception  # type: ignore[misc,assignment]
 
+try:
+    # orjson's SIMD parser/encoder is several times faster than stdlib json on
+    # dumps of this shape; fall back silently when it is not installed.
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize to 2-space-indented JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # pragma: no cover
+    _loads = json.loads  # type: ignore[assignment]
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize to 2-space-indented JSON bytes."""
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 
 # Public, resized poster base used by RevivalHub uploads
 POSTER_IMG_BASE = (
@@ -36,6 +59,40 @@ POSTER_IMG_BASE = (
 # RevivalHub poster paths are TMDB poster hashes, so posters missing from the
 # RevivalHub bucket (it only mirrors a subset) can be served from TMDB's CDN.
 TMDB_IMG_BASE = "https://image.tmdb.org/t/p/w500"
+# Precompiled patterns: hot helpers should not re-assemble or re-lookup
+# their regexes per call.
+_TOKEN_SPLIT_RE = re.compile(r"[^a-z0-9]+")
+_BUCKET_POSTER_RE = re.compile(
+    re.escape(POSTER_IMG_BASE) + r"/(?P<root>[^/]+?)(?:_\d+x\d+)?\.jpg$"
+)
+
+# Shared HTTP session so the dump fetch and poster checks reuse pooled
+# connections (no fresh TLS handshake per call) and retry transient failures.
+# Pool sizing matches actual fan-out: RevivalHub, the poster bucket and the
+# TMDB CDN, with concurrent poster probes from worker threads.
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+_SESSION = requests.Session()
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+# On-disk dump cache backing conditional GETs: when RevivalHub answers
+# 304 Not Modified we reuse the previously downloaded body. Filenames are
+# keyed by URL so each endpoint gets its own body/validator triplet.
+CACHE_DIR = Path(tempfile.gettempdir()) / "revivalhub_trmnl_sync"
+
+
+def _dump_cache_paths(url: str) -> tuple[Path, Path, Path]:
+    """Return the (body, etag, last-modified) cache paths for ``url``."""
+    stem = hashlib.sha1(url.encode()).hexdigest()
+    return (
+        CACHE_DIR / f"{stem}.json",
+        CACHE_DIR / f"{stem}.etag",
+        CACHE_DIR / f"{stem}.lastmod",
+    )
 
 # Ticket-URL slug tokens that describe the presentation, not the film title.
 SLUG_NOISE_TOKENS = {
@@ -44,8 +101,10 @@ SLUG_NOISE_TOKENS = {
     "restoration", "restored", "print", "presents", "presented", "premiere",
     "screening", "matinee", "double", "feature", "anniversary", "edition",
 }
-POSTER_DIRECT_KEYS = ["poster", "poster_url", "image", "artwork", "image_url"]
-POSTER_SLUG_KEYS = [
+# Key-priority tuples used by _coalesce; built once so the hot extraction
+# paths never allocate a fresh list per entry.
+POSTER_DIRECT_KEYS = ("poster", "poster_url", "image", "artwork", "image_url")
+POSTER_SLUG_KEYS = (
     "poster-image-path",
     "poster_image_path",
     "posterImagePath",
@@ -53,12 +112,35 @@ POSTER_SLUG_KEYS = [
     "poster_path",
     "posterSlug",
     "poster_slug",
-]
-FILM_TITLE_KEYS = ["title", "film", "movie", "name", "filmTitle"]
-TMDB_ID_KEYS = ["tmdb_id", "tmdbId", "tmdbID"]
+)
+FILM_TITLE_KEYS = ("title", "film", "movie", "name", "filmTitle")
+TMDB_ID_KEYS = ("tmdb_id", "tmdbId", "tmdbID")
+VENUE_ID_KEYS = ("venueId", "venue_id", "venueID", "venue")
+VENUE_LABEL_KEYS = (
+    "venue_name", "theatre_name", "theatre", "theater", "cinema", "location"
+)
+SHOWTIME_KEYS = ("showtime", "show_time", "when", "datetime", "start_at")
+TICKET_URL_KEYS = ("ticket_url", "tickets", "link", "url")
+# Single-pass extraction table for _screening_index: key -> (slot, rank).
+# Walking entry.items() once replaces one key-priority probe per field; the
+# rank preserves the priority order of the tuples above when an entry carries
+# alternate spellings of the same field.
+_ENTRY_FIELD_MAP: dict[str, tuple[int, int]] = {
+    _key: (_slot, _rank)
+    for _slot, _keys in enumerate(
+        (VENUE_ID_KEYS, VENUE_LABEL_KEYS, SHOWTIME_KEYS, ("showtimes",), ("screening_times",))
+    )
+    for _rank, _key in enumerate(_keys)
+}
+# Keys whose presence marks a dict as a flattened screening entry; probed via
+# dict-keys isdisjoint so each test walks these small sets, not the entry.
+_TERMINAL_TITLE_KEYS = frozenset({"title", "film", "films"})
+_TERMINAL_TIME_KEYS = frozenset({"showtime", "showtimes", "when", "screening_times"})
+# Cached to skip the dt.timezone attribute lookup on hot parse/compare paths.
+_UTC = dt.timezone.utc
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Screening:
     """Normalized representation of a single screening."""
 
@@ -77,20 +159,19 @@ class Screening:
 
     def format_when_text(self) -> str:
         local = self.when_local
-        day_str = str(local.day)
-        time_str = _format_time(local)
-        # Render weekday and month via strftime so %a/%b are expanded
+        # Single strftime for the locale-ish tokens (%a/%b); day and time are
+        # cheaper to format arithmetically than via a second strftime pass.
         prefix = local.strftime("%a • %b")
-        return f"{prefix} {day_str} • {time_str}"
+        return f"{prefix} {local.day} • {_format_time(local)}"
 
 
 def _format_time(value: dt.datetime) -> str:
     """Return a platform-safe 12h timestamp without leading zeros."""
-    time_token = value.strftime("%I:%M %p")
-    # Strip leading zero while retaining '12'.
-    if time_token.startswith("0"):
-        time_token = time_token[1:]
-    return time_token
+    # Arithmetic instead of strftime("%I:%M %p") + zero-strip: no format
+    # parsing, no buffer, and '12' is preserved by the `or 12`.
+    hour = value.hour % 12 or 12
+    suffix = "AM" if value.hour < 12 else "PM"
+    return f"{hour}:{value.minute:02d} {suffix}"
 
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
@@ -160,12 +241,16 @@ def main(argv: Sequence[str] | None = None) -> int:
         verify_poster=not args.skip_poster_check,
     )
 
+    # Serialize once; the same bytes serve both the file and stdout.
+    body = _dumps(payload) if (args.payload_path or args.dry_run) else b""
+
     if args.payload_path:
-        Path(args.payload_path).write_text(json.dumps(payload, indent=2))
+        Path(args.payload_path).write_bytes(body)
         logging.info("Wrote payload to %s", args.payload_path)
 
     if args.dry_run:
-        print(json.dumps(payload, indent=2))
+        sys.stdout.buffer.write(body + b"\n")
+        sys.stdout.buffer.flush()
         return 0
 
     # Not dry-run: we already wrote the file if --payload-path was provided.
@@ -181,9 +266,7 @@ def fetch_payload(
     verify_poster: bool = True,
 ) -> Mapping[str, Any]:
     logging.info("Fetching RevivalHub data from %s", revivalhub_url)
-    response = requests.get(revivalhub_url, timeout=30)
-    response.raise_for_status()
-    source = response.json()
+    source = _fetch_dump(revivalhub_url)
 
     screening = find_next_screening(
         source=source,
@@ -211,6 +294,64 @@ def fetch_payload(
     return build_trmnl_payload(screening=screening)
 
 
+def _download_dump(url: str) -> tuple[bytes, Path | None]:
+    """Fetch the RevivalHub dump, reusing the cached body on 304 Not Modified.
+
+    Returns the body and the cache file it matches (served from it on a 304,
+    or freshly written to it on a 200 carrying validators), or ``None`` when
+    the body is not backed by the cache.
+    """
+    cache_fp, etag_fp, lastmod_fp = _dump_cache_paths(url)
+    headers: dict[str, str] = {}
+    if cache_fp.exists():
+        if etag_fp.exists():
+            headers["If-None-Match"] = etag_fp.read_text().strip()
+        if lastmod_fp.exists():
+            headers["If-Modified-Since"] = lastmod_fp.read_text().strip()
+    response = _SESSION.get(url, headers=headers, timeout=30)
+    if response.status_code == 304:
+        logging.info("RevivalHub dump unchanged (HTTP 304); using cached copy.")
+        return cache_fp.read_bytes(), cache_fp
+    response.raise_for_status()
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_fp.write_bytes(response.content)
+            if etag:
+                etag_fp.write_text(etag)
+            else:
+                etag_fp.unlink(missing_ok=True)
+            if last_modified:
+                lastmod_fp.write_text(last_modified)
+            else:
+                lastmod_fp.unlink(missing_ok=True)
+        except OSError as exc:
+            logging.debug("Could not cache dump: %s", exc)
+        else:
+            return response.content, cache_fp
+    return response.content, None
+
+
+@functools.lru_cache(maxsize=4)
+def _load_dump(cache_fp: Path, mtime_ns: int) -> Any:
+    """Parse a cached dump once per on-disk version (keyed by path + mtime)."""
+    return _loads(cache_fp.read_bytes())
+
+
+def _fetch_dump(url: str) -> Any:
+    """Return the parsed RevivalHub dump, reusing a prior parse when possible."""
+    body, cache_fp = _download_dump(url)
+    if cache_fp is not None:
+        try:
+            return _load_dump(cache_fp, cache_fp.stat().st_mtime_ns)
+        except OSError:
+            # Cache unavailable (e.g. read-only temp dir); parse the body directly.
+            pass
+    return _loads(body)
+
+
 def find_next_screening(
     source: Any,
     theatre: str,
@@ -222,142 +363,239 @@ def find_next_screening(
     film_catalog = _collect_films(source)
     film_index = _build_film_index(film_catalog)
     theatre_is_id = theatre in venue_index
-    now = dt.datetime.now(dt.timezone.utc)
+    # Lowercase every venue name once, up front: the per-venue loop then
+    # matches by id membership instead of re-lowercasing labels.
+    matching_venue_ids = {
+        vid for vid, name in venue_index.items() if theatre_lower in name.lower()
+    }
+    now = dt.datetime.now(_UTC)
     cutoff = now + dt.timedelta(hours=lookahead_hours)
 
-    candidates: list[Screening] = []
-    for entry in iter_screenings(source):
-        # Resolve venue id -> label when possible
-        venue_id = _coalesce(entry, ["venueId", "venue_id", "venueID", "venue"])
-        venue_label = None
-        if isinstance(venue_id, str) and venue_id in venue_index:
-            venue_label = venue_index[venue_id]
-        if not venue_label:
-            venue_label = _coalesce(
-                entry,
-                ["venue_name", "theatre_name", "theatre", "theater", "cinema", "location"],
-            )
-
+    # Running minimum over (when, entry, key, label) per matching venue;
+    # poster/ticket/title extraction is deferred until the single winner is
+    # known.
+    best: tuple[dt.datetime, MutableMapping[str, Any], str, str | None] | None = None
+    index = _screening_index(source, timezone, venue_index, now=now, cutoff=cutoff)
+    for key, (venue_label, labels, entries) in index.items():
         # Match either by exact ID or by human label substring
-        matches = False
-        if theatre_is_id and venue_id == theatre:
-            matches = True
-        elif venue_label and theatre_lower in str(venue_label).lower():
-            matches = True
+        matches = key in matching_venue_ids or (theatre_is_id and key == theatre)
+        if not matches and key not in venue_index:
+            # Unindexed venues carry no canonical name; match against every
+            # label their entries supplied.
+            matches = any(theatre_lower in label for label in labels)
         if not matches:
             continue
 
-        showtime_raw = _coalesce(
-            entry, ["showtime", "show_time", "when", "datetime", "start_at"]
-        )
-        if not showtime_raw:
-            showtimes = entry.get("showtimes") if isinstance(entry, Mapping) else None
-            if isinstance(showtimes, list) and showtimes:
-                showtime_raw = showtimes[0]
-        if not showtime_raw:
-            screening_times = (
-                entry.get("screening_times") if isinstance(entry, Mapping) else None
-            )
-            if isinstance(screening_times, list) and screening_times:
-                showtime_raw = screening_times[0]
-        when = parse_datetime(showtime_raw, timezone)
-        if not when:
-            logging.debug("Skipping entry with unparseable time: %s", entry)
-            continue
-        if when < now or when > cutoff:
+        # Entries are sorted by showtime: bisect to "now", and since only the
+        # earliest upcoming show can win, consider just that one entry per
+        # venue instead of walking the rest of the horizon.
+        start = bisect.bisect_left([when for when, _ in entries], now)
+        if start == len(entries):
             continue
+        when, entry = entries[start]
+        if when <= cutoff and (best is None or when < best[0]):
+            best = (when, entry, key, venue_label)
 
-        poster_url = _poster_url_for_entry(entry, film_index)
-
-        # Ticket URL: prefer single url fields, else first from ticket_urls[]
-        ticket_url = _coalesce(entry, ["ticket_url", "tickets", "link", "url"])
-        if not ticket_url:
-            urls = entry.get("ticket_urls") if isinstance(entry, Mapping) else None
-            if isinstance(urls, list) and urls:
-                ticket_url = urls[0]
-
-        # Title: prefer explicit titles, then filmTitle, then first film name
-        title = _coalesce(entry, FILM_TITLE_KEYS)
-        if not title:
-            films = entry.get("films") if isinstance(entry, Mapping) else None
-            if isinstance(films, list) and films:
-                first = films[0]
-                if isinstance(first, Mapping):
-                    title = first.get("name") or first.get("title")
-        title = title or "Untitled"
-
-        screening = Screening(
-            theatre=venue_label or str(venue_id or ""),
-            title=title,
-            when=when,
-            timezone=timezone,
-            poster_url=poster_url,
-            ticket_url=ticket_url,
-            raw=entry,
-        )
-        candidates.append(screening)
-
-    candidates.sort(key=lambda s: s.when)
-    if not candidates:
+    if best is None:
         return None
-    return _correct_film_from_ticket_slug(candidates[0], film_catalog)
+    when, entry, key, venue_label = best
+    if key not in venue_index:
+        # Prefer the winning entry's own label over the group's.
+        venue_label = _coalesce(entry, VENUE_LABEL_KEYS) or venue_label
+    theatre_name = str(venue_label or key)
+
+    poster_url = _poster_url_for_entry(entry, film_index)
+
+    # Ticket URL: prefer single url fields, else first from ticket_urls[]
+    ticket_url = _coalesce(entry, TICKET_URL_KEYS)
+    if not ticket_url:
+        urls = entry.get("ticket_urls") if isinstance(entry, dict) else None
+        if isinstance(urls, list) and urls:
+            ticket_url = urls[0]
+
+    # Title: prefer explicit titles, then filmTitle, then first film name
+    title = _coalesce(entry, FILM_TITLE_KEYS)
+    if not title:
+        films = entry.get("films") if isinstance(entry, dict) else None
+        if isinstance(films, list) and films:
+            first = films[0]
+            if isinstance(first, dict):
+                title = first.get("name") or first.get("title")
+    title = title or "Untitled"
+
+    screening = Screening(
+        theatre=theatre_name,
+        title=title,
+        when=when,
+        timezone=timezone,
+        poster_url=poster_url,
+        ticket_url=ticket_url,
+        raw=entry,
+    )
+    return _correct_film_from_ticket_slug(screening, film_catalog)
 
 
 def iter_screenings(source: Any) -> Iterable[MutableMapping[str, Any]]:
-    """Yield flattened screening dictionaries from a loose RevivalHub payload."""
-    if isinstance(source, Mapping):
-        if "screenings" in source and isinstance(source["screenings"], list):
-            parent = {k: v for k, v in source.items() if k != "screenings"}
-            for child in source["screenings"]:
-                merged: MutableMapping[str, Any]
-                if isinstance(child, Mapping):
-                    merged = {**parent, **child}
-                    yield from iter_screenings(merged)
-                else:
-                    merged = dict(parent)
-                    merged["showtimes"] = child
-                    yield from iter_screenings(merged)
-            return
-
-        keys = set(source.keys())
-        if ("title" in keys or "film" in keys or "films" in keys) and (
-            "showtime" in keys or "showtimes" in keys or "when" in keys or "screening_times" in keys
+    """Yield flattened screening dictionaries from a loose RevivalHub payload.
+
+    Walks the tree with an explicit work stack rather than recursive
+    generators, so deep dumps cost no nested generator frames and cannot hit
+    the recursion limit.
+    """
+    # The second stack element marks dicts this walk built itself (parent/child
+    # merges); those are already private copies and can be yielded as-is
+    # instead of being copied a second time.
+    stack: list[tuple[Any, bool]] = [(source, False)]
+    while stack:
+        obj, owned = stack.pop()
+        if isinstance(obj, dict):
+            if "screenings" in obj and isinstance(obj["screenings"], list):
+                parent = {k: v for k, v in obj.items() if k != "screenings"}
+                for child in obj["screenings"]:
+                    merged: MutableMapping[str, Any]
+                    if isinstance(child, dict):
+                        merged = {**parent, **child}
+                    else:
+                        merged = dict(parent)
+                        merged["showtimes"] = child
+                    stack.append((merged, True))
+                continue
+
+            keys = obj.keys()
+            if not keys.isdisjoint(_TERMINAL_TITLE_KEYS) and not keys.isdisjoint(
+                _TERMINAL_TIME_KEYS
+            ):
+                yield obj if owned else dict(obj)
+                continue
+            stack.extend((value, False) for value in obj.values())
+        elif isinstance(obj, list):
+            stack.extend((item, False) for item in obj)
+
+
+def _screening_index(
+    source: Any,
+    timezone: str,
+    venue_index: Mapping[str, str],
+    now: dt.datetime | None = None,
+    cutoff: dt.datetime | None = None,
+) -> dict[
+    str,
+    tuple[str | None, set[str], list[tuple[dt.datetime, MutableMapping[str, Any]]]],
+]:
+    """Group screenings by venue with showtimes parsed once and sorted.
+
+    Keys are venue ids when the entry carries one, else the entry's human
+    label. Each group stores a display label (from ``venue_index``, else the
+    first entry that supplies one) plus, for venues absent from
+    ``venue_index``, the lowered labels of every entry seen — sibling entries
+    may be inconsistently labeled, so matching must consider all of them.
+
+    When ``now``/``cutoff`` are given, ISO-dated strings far outside that
+    window are rejected lexically (date-prefix comparison, two-day margin for
+    timezone skew) before any datetime is constructed — dumps are dominated
+    by past and far-future shows the caller can never select.
+    """
+    floor_prefix = ceil_prefix = None
+    if now is not None:
+        floor_prefix = (now - dt.timedelta(days=2)).strftime("%Y-%m-%d")
+    if cutoff is not None:
+        ceil_prefix = (cutoff + dt.timedelta(days=2)).strftime("%Y-%m-%d")
+
+    index: dict[
+        str,
+        tuple[str | None, set[str], list[tuple[dt.datetime, MutableMapping[str, Any]]]],
+    ] = {}
+    tzinfo = _tzinfo(timezone)  # resolved once; ZoneInfo lookups are not free
+    for entry in iter_screenings(source):
+        # One pass over the entry fills every slot at once (see
+        # _ENTRY_FIELD_MAP); typical entries have ~10 keys, so this beats
+        # separate key-priority probes per field.
+        fields: list[tuple[int, Any] | None] = [None, None, None, None, None]
+        for entry_key, value in entry.items():
+            hit = _ENTRY_FIELD_MAP.get(entry_key)
+            if hit is None or not value:
+                continue
+            slot, rank = hit
+            current = fields[slot]
+            if current is None or rank < current[0]:
+                fields[slot] = (rank, value)
+
+        venue_id = fields[0][1] if fields[0] else None
+        raw_label = fields[1][1] if fields[1] else None
+        key = venue_id if isinstance(venue_id, str) else None
+        if key is None:
+            if not raw_label:
+                continue
+            key = str(raw_label)
+
+        showtime_raw = fields[2][1] if fields[2] else None
+        if not showtime_raw and fields[3]:
+            showtimes = fields[3][1]
+            if isinstance(showtimes, list):
+                showtime_raw = showtimes[0]
+        if not showtime_raw and fields[4]:
+            screening_times = fields[4][1]
+            if isinstance(screening_times, list):
+                showtime_raw = screening_times[0]
+        if (
+            isinstance(showtime_raw, str)
+            and len(showtime_raw) >= 10
+            and showtime_raw[:4].isdigit()
+            # Extended form only: basic-format ISO strings ("20260827T…")
+            # also parse, but their prefixes don't compare against ours.
+            and showtime_raw[4] == "-"
+            and showtime_raw[7] == "-"
         ):
-            yield dict(source)
-            return
-        for value in source.values():
-            yield from iter_screenings(value)
-    elif isinstance(source, list):
-        for item in source:
-            yield from iter_screenings(item)
+            prefix = showtime_raw[:10]
+            if (floor_prefix and prefix < floor_prefix) or (
+                ceil_prefix and prefix > ceil_prefix
+            ):
+                continue
+        when = parse_datetime(showtime_raw, timezone, tzinfo)
+        if not when:
+            logging.debug("Skipping entry with unparseable time: %s", entry)
+            continue
+
+        group = index.get(key)
+        if group is None:
+            group = (venue_index.get(key), set(), [])
+            index[key] = group
+        if raw_label and key not in venue_index:
+            group[1].add(str(raw_label).lower())
+            if group[0] is None:
+                # A later sibling supplied the label the first entry lacked.
+                group = (str(raw_label), group[1], group[2])
+                index[key] = group
+        group[2].append((when, entry))
+
+    for _, _, entries in index.values():
+        entries.sort(key=lambda pair: pair[0])
+    return index
+
 
+def parse_datetime(
+    raw: Any, timezone: str, tzinfo: dt.tzinfo | None = None
+) -> dt.datetime | None:
+    """Parse a raw showtime to aware UTC.
 
-def parse_datetime(raw: Any, timezone: str) -> dt.datetime | None:
+    Callers parsing in a loop should pass a pre-resolved ``tzinfo`` so naive
+    strings do not trigger a ZoneInfo lookup per entry.
+    """
     if raw is None:
         return None
     if isinstance(raw, (int, float)):
-        return dt.datetime.fromtimestamp(raw, tz=dt.timezone.utc)
+        return dt.datetime.fromtimestamp(raw, tz=_UTC)
     if isinstance(raw, str):
-        raw = raw.strip()
-        # Normalize trailing Z to +00:00 for fromisoformat/strptime compatibility
-        if raw.endswith("Z"):
-            raw = raw[:-1] + "+00:00"
-        for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M:%S"):
-            try:
-                parsed = dt.datetime.strptime(raw, fmt)
-                if not parsed.tzinfo:
-                    parsed = parsed.replace(tzinfo=_tzinfo(timezone))
-                return parsed.astimezone(dt.timezone.utc)
-            except ValueError:
-                continue
-        # Fallback to fromisoformat if available.
+        # On Python 3.11+ (the project floor) fromisoformat natively accepts
+        # every shape the old strptime ladder covered — trailing 'Z', space
+        # separators, bare offsets — so it is the whole string path now.
         try:
-            parsed = dt.datetime.fromisoformat(raw)
-            if not parsed.tzinfo:
-                parsed = parsed.replace(tzinfo=_tzinfo(timezone))
-            return parsed.astimezone(dt.timezone.utc)
+            parsed = dt.datetime.fromisoformat(raw.strip())
         except ValueError:
             return None
+        if not parsed.tzinfo:
+            parsed = parsed.replace(tzinfo=tzinfo or _tzinfo(timezone))
+        return parsed.astimezone(_UTC)
     return None
 
 
@@ -388,13 +626,13 @@ def build_trmnl_payload(screening: Screening) -> Mapping[str, Any]:
         "day_end_epoch": int(day_end_local.timestamp()),
         # Legacy preformatted string, kept so older template revisions render.
         "subtitle": screening.format_when_text(),
-        "refreshed_at": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "refreshed_at": dt.datetime.now(_UTC).isoformat(),
     }
     return payload
 
 
 def build_placeholder_payload(theatre: str, timezone: str) -> Mapping[str, Any]:
-    now = dt.datetime.now(dt.timezone.utc)
+    now = dt.datetime.now(_UTC)
     tz = _tzinfo(timezone)
     local = now.astimezone(tz) if tz else now
     return {
@@ -409,8 +647,11 @@ def build_placeholder_payload(theatre: str, timezone: str) -> Mapping[str, Any]:
 
 def _coalesce(entry: Mapping[str, Any], keys: Iterable[str]) -> Any | None:
     for key in keys:
-        if key in entry and entry[key]:
-            return entry[key]
+        # Single .get probe instead of `key in entry` + `entry[key]` (two
+        # hash lookups); this helper runs several times per entry.
+        value = entry.get(key)
+        if value:
+            return value
     return None
 
 
@@ -465,10 +706,10 @@ def _collect_films(source: Any) -> list[Mapping[str, Any]]:
     found: list[Mapping[str, Any]] = []
 
     def walk(obj: Any) -> None:
-        if isinstance(obj, Mapping):
+        if isinstance(obj, dict):
             films = obj.get("films")
             if isinstance(films, list):
-                found.extend(f for f in films if isinstance(f, Mapping))
+                found.extend(f for f in films if isinstance(f, dict))
             for val in obj.values():
                 walk(val)
         elif isinstance(obj, list):
@@ -496,7 +737,7 @@ def _build_film_index(films: Sequence[Mapping[str, Any]]) -> dict[str, Mapping[s
 
 
 def _normalize_tokens(text: Any) -> list[str]:
-    return [t for t in re.split(r"[^a-z0-9]+", str(text).lower()) if t]
+    return [t for t in _TOKEN_SPLIT_RE.split(str(text).lower()) if t]
 
 
 def _ticket_slug_tokens(ticket_url: Any) -> list[str]:
@@ -616,10 +857,7 @@ def _correct_film_from_ticket_slug(
 
 def _tmdb_fallback_url(poster_url: str) -> str | None:
     """TMDB CDN equivalent of a RevivalHub resized-bucket poster URL."""
-    match = re.match(
-        re.escape(POSTER_IMG_BASE) + r"/(?P<root>[^/]+?)(?:_\d+x\d+)?\.jpg$",
-        poster_url,
-    )
+    match = _BUCKET_POSTER_RE.match(poster_url)
     if not match:
         return None
     return f"{TMDB_IMG_BASE}/{match.group('root')}.jpg"
@@ -638,17 +876,30 @@ def _verify_poster_url(poster_url: str | None) -> str | None:
     fallback = _tmdb_fallback_url(poster_url)
     if fallback:
         candidates.append(fallback)
-    for candidate in candidates:
+
+    def check(candidate: str) -> int | None:
         try:
-            response = requests.head(candidate, timeout=15, allow_redirects=True)
+            response = _SESSION.head(candidate, timeout=15, allow_redirects=True)
         except requests.RequestException as exc:
             logging.warning("Poster check failed for %s: %s", candidate, exc)
-            continue
-        if response.status_code == 200:
+            return None
+        return response.status_code
+
+    # Probe the bucket and the TMDB fallback concurrently (the checks hit
+    # different hosts), then honor the original preference order.
+    if len(candidates) > 1:
+        with ThreadPoolExecutor(max_workers=len(candidates)) as pool:
+            statuses = list(pool.map(check, candidates))
+    else:
+        statuses = [check(candidates[0])]
+
+    for candidate, status in zip(candidates, statuses):
+        if status == 200:
             if candidate != poster_url:
                 logging.info("Poster missing from RevivalHub bucket; using %s", candidate)
             return candidate
-        logging.warning("Poster URL %s returned HTTP %s", candidate, response.status_code)
+        if status is not None:
+            logging.warning("Poster URL %s returned HTTP %s", candidate, status)
     logging.warning("No working poster URL found; omitting poster.")
     return None
 
@@ -665,25 +916,44 @@ def _film_index_keys(film: Mapping[str, Any]) -> Iterable[str]:
             yield f"title:{normalized}"
 
 
+@functools.lru_cache(maxsize=8)
 def _tzinfo(timezone: str) -> dt.tzinfo:
+    # Cached so repeated callers (when_local, parse_datetime fallbacks) do not
+    # re-run ZoneInfo construction, and the unknown-zone warning fires once.
     if ZoneInfo:
         try:
             return ZoneInfo(timezone)
         except ZoneInfoNotFoundError:
             logging.warning("Unknown timezone '%s'; falling back to UTC.", timezone)
-    return dt.timezone.utc
+    return _UTC
 
 
 def _build_venue_index(source: Any) -> dict[str, str]:
     """Return a mapping of venue id -> human-readable name if present."""
     index: dict[str, str] = {}
 
+    # Canonical dumps carry one top-level "venues" list; read it directly and
+    # reserve the full recursive walk for looser shapes. reversed() keeps
+    # first-occurrence-wins, matching the setdefault in the walk below.
+    if isinstance(source, dict):
+        venues = source.get("venues")
+        if isinstance(venues, list):
+            fast = {
+                vid: name
+                for v in reversed(venues)
+                if isinstance(v, dict)
+                and isinstance(vid := (v.get("id") or v.get("venueId") or v.get("key")), str)
+                and isinstance(name := (v.get("name") or v.get("label") or v.get("title")), str)
+            }
+            if fast:
+                return fast
+
     def walk(obj: Any) -> None:
-        if isinstance(obj, Mapping):
+        if isinstance(obj, dict):
             venues = obj.get("venues")
             if isinstance(venues, list):
                 for v in venues:
-                    if isinstance(v, Mapping):
+                    if isinstance(v, dict):
                         vid = v.get("id") or v.get("venueId") or v.get("key")
                         name = v.get("name") or v.get("label") or v.get("title")
                         if isinstance(vid, str) and isinstance(name, str):
@@ -706,16 +976,12 @@ def _poster_url_from_slug(slug: Any) -> str | None:
     """
     if not slug:
         return None
-    try:
-        slug_str = str(slug).strip().strip("/")
-        # Drop any extension and leading folders
-        base_name = slug_str.split("/")[-1]
-        root = os.path.splitext(base_name)[0]
-        if not root:
-            return None
-        return f"{POSTER_IMG_BASE}/{root}_400x600.jpg"
-    except Exception:
+    # Drop any leading folders, then the extension; plain string ops only.
+    base = str(slug).strip().strip("/").rsplit("/", 1)[-1]
+    root = base.rsplit(".", 1)[0] if "." in base else base
+    if not root:
         return None
+    return f"{POSTER_IMG_BASE}/{root}_400x600.jpg"
 
 
 if __name__ == "__main__":
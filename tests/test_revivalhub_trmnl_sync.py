@@ -1,10 +1,15 @@
 import datetime as dt
+import tempfile
 import unittest
+from pathlib import Path
 from unittest import mock
 
 from src.revivalhub_trmnl_sync import (
     POSTER_IMG_BASE,
     TMDB_IMG_BASE,
+    _download_dump,
+    _fetch_dump,
+    _load_dump,
     _tmdb_fallback_url,
     _verify_poster_url,
     find_next_screening,
@@ -141,6 +146,51 @@ class FindNextScreeningTests(unittest.TestCase):
             f"{POSTER_IMG_BASE}/1SshlLXCfFgqX9iJLtwPuAYh4Bx_400x600.jpg",
         )
 
+    def test_mixed_label_siblings_match_regardless_of_order(self):
+        # Entries sharing a venue id that is absent from the top-level venues
+        # list may be inconsistently labeled; one unlabeled sibling must not
+        # keep the group from matching, and the result must not depend on
+        # dump ordering.
+        now = dt.datetime.now(dt.timezone.utc)
+        labeled = {
+            "venueId": "vX",
+            "venue_name": "Vista Theatre",
+            "title": "Labeled",
+            "showtime": (now + dt.timedelta(hours=2)).isoformat(),
+        }
+        unlabeled = {
+            "venueId": "vX",
+            "title": "Unlabeled",
+            "showtime": (now + dt.timedelta(hours=1)).isoformat(),
+        }
+        for order in ([labeled, unlabeled], [unlabeled, labeled]):
+            with self.subTest(first=order[0]["title"]):
+                screening = find_next_screening(
+                    source={"screenings": list(order)},
+                    theatre="Vista",
+                    timezone="America/Los_Angeles",
+                    lookahead_hours=4,
+                )
+
+                self.assertIsNotNone(screening)
+                self.assertEqual(screening.title, "Unlabeled")
+                self.assertEqual(screening.theatre, "Vista Theatre")
+
+    def test_accepts_basic_format_iso_showtimes(self):
+        # fromisoformat on 3.11 also parses basic-format strings; the lexical
+        # date-window guard must not reject them.
+        showtime = dt.datetime.now(dt.timezone.utc) + dt.timedelta(hours=1)
+        source = _source(
+            screening_overrides={
+                "screening_times": [showtime.strftime("%Y%m%dT%H%M%S%z")]
+            }
+        )
+
+        screening = _find(source)
+
+        self.assertIsNotNone(screening)
+        self.assertEqual(screening.title, "The Searchers")
+
     def test_keeps_linked_film_when_no_ticket_url(self):
         source = _source(screening_overrides={"ticket_urls": []})
 
@@ -169,7 +219,7 @@ class PosterVerificationTests(unittest.TestCase):
             response.status_code = 200 if url == tmdb_url else 403
             return response
 
-        with mock.patch("src.revivalhub_trmnl_sync.requests.head", side_effect=fake_head):
+        with mock.patch("src.revivalhub_trmnl_sync._SESSION.head", side_effect=fake_head):
             self.assertEqual(_verify_poster_url(bucket_url), tmdb_url)
 
     def test_verify_poster_returns_none_when_all_candidates_fail(self):
@@ -180,7 +230,7 @@ class PosterVerificationTests(unittest.TestCase):
             response.status_code = 403
             return response
 
-        with mock.patch("src.revivalhub_trmnl_sync.requests.head", side_effect=fake_head):
+        with mock.patch("src.revivalhub_trmnl_sync._SESSION.head", side_effect=fake_head):
             self.assertIsNone(_verify_poster_url(bucket_url))
 
     def test_verify_poster_keeps_bucket_url_when_it_serves(self):
@@ -191,9 +241,104 @@ class PosterVerificationTests(unittest.TestCase):
             response.status_code = 200
             return response
 
-        with mock.patch("src.revivalhub_trmnl_sync.requests.head", side_effect=fake_head):
+        with mock.patch("src.revivalhub_trmnl_sync._SESSION.head", side_effect=fake_head):
             self.assertEqual(_verify_poster_url(bucket_url), bucket_url)
 
 
+class DumpDownloadTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = mock.patch("src.revivalhub_trmnl_sync.CACHE_DIR", Path(tmp.name))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        _load_dump.cache_clear()
+        self.addCleanup(_load_dump.cache_clear)
+
+    def test_caches_body_and_etag_on_200(self):
+        response = mock.Mock(
+            status_code=200, content=b'{"screenings": []}', headers={"ETag": 'W/"v1"'}
+        )
+        with mock.patch(
+            "src.revivalhub_trmnl_sync._SESSION.get", return_value=response
+        ) as fake_get:
+            body, cache_fp = _download_dump("https://example.com/dump.json")
+
+        self.assertEqual(body, b'{"screenings": []}')
+        self.assertIsNotNone(cache_fp)
+        self.assertNotIn("If-None-Match", fake_get.call_args.kwargs["headers"])
+
+    def test_reuses_cached_body_on_304(self):
+        fresh = mock.Mock(
+            status_code=200, content=b'{"screenings": []}', headers={"ETag": 'W/"v1"'}
+        )
+        not_modified = mock.Mock(status_code=304)
+        with mock.patch(
+            "src.revivalhub_trmnl_sync._SESSION.get",
+            side_effect=[fresh, not_modified],
+        ) as fake_get:
+            _download_dump("https://example.com/dump.json")
+            body, cache_fp = _download_dump("https://example.com/dump.json")
+
+        self.assertEqual(body, b'{"screenings": []}')
+        self.assertIsNotNone(cache_fp)
+        self.assertEqual(
+            fake_get.call_args.kwargs["headers"]["If-None-Match"], 'W/"v1"'
+        )
+
+    def test_sends_if_modified_since_when_only_last_modified_known(self):
+        stamp = "Wed, 08 Jul 2026 19:30:00 GMT"
+        fresh = mock.Mock(
+            status_code=200,
+            content=b'{"screenings": []}',
+            headers={"Last-Modified": stamp},
+        )
+        not_modified = mock.Mock(status_code=304)
+        with mock.patch(
+            "src.revivalhub_trmnl_sync._SESSION.get",
+            side_effect=[fresh, not_modified],
+        ) as fake_get:
+            _download_dump("https://example.com/dump.json")
+            body, _ = _download_dump("https://example.com/dump.json")
+
+        self.assertEqual(body, b'{"screenings": []}')
+        headers = fake_get.call_args.kwargs["headers"]
+        self.assertEqual(headers["If-Modified-Since"], stamp)
+        self.assertNotIn("If-None-Match", headers)
+
+    def test_validators_do_not_leak_across_urls(self):
+        # The cache is keyed by URL: a validator stored for one endpoint must
+        # not be sent to another.
+        response_a = mock.Mock(
+            status_code=200, content=b'{"site": "a"}', headers={"ETag": 'W/"a1"'}
+        )
+        response_b = mock.Mock(status_code=200, content=b'{"site": "b"}', headers={})
+        with mock.patch(
+            "src.revivalhub_trmnl_sync._SESSION.get",
+            side_effect=[response_a, response_b],
+        ) as fake_get:
+            _download_dump("https://a.example.com/dump.json")
+            body, _ = _download_dump("https://b.example.com/dump.json")
+
+        self.assertEqual(body, b'{"site": "b"}')
+        self.assertNotIn("If-None-Match", fake_get.call_args.kwargs["headers"])
+
+    def test_fetch_prefers_fresh_body_over_stale_cache(self):
+        # A 200 without validators never rewrites the cache file, so the
+        # parsed result must come from the new body, not the stale copy.
+        stale = mock.Mock(
+            status_code=200, content=b'{"version": "OLD"}', headers={"ETag": 'W/"v1"'}
+        )
+        fresh = mock.Mock(status_code=200, content=b'{"version": "NEW"}', headers={})
+        with mock.patch(
+            "src.revivalhub_trmnl_sync._SESSION.get",
+            side_effect=[stale, fresh],
+        ):
+            _fetch_dump("https://example.com/dump.json")
+            source = _fetch_dump("https://example.com/dump.json")
+
+        self.assertEqual(source["version"], "NEW")
+
+
 if __name__ == "__main__":
     unittest.main()